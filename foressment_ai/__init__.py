@@ -19,7 +19,7 @@ from foressment_ai.assessment.assessor_ai.autoencoder import AutoEncoder
 
 from foressment_ai.forecasting.forecaster_ai.forecaster import (
     ForecastEstimator, ForecasterParameters, NaiveForecaster, TSGenerator, DeepForecasterParameters,
-    DeepForecasterTuner, DeepForecaster)
+    DeepForecasterTuner, DeepForecaster, set_mixed_precision_policy)
 from foressment_ai.forecasting.forecaster_ai.logger import Logger
 from foressment_ai.forecasting.forecaster_ai.loader import \
     DataLoaderAndPreprocessorDefault as DataLoader, \
@@ -1,22 +1,193 @@
+import gc
 import os
+import tensorflow as tf
 from keras.models import load_model, Sequential
 from keras.layers import Dense, Reshape, LSTM, Input, Dropout, SimpleRNN, GRU
-from tensorflow.keras.callbacks import EarlyStopping
+from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
+from tensorflow.keras import mixed_precision
 from keras import optimizers
-import keras_tuner  # keras-tuner + grpcio (ver. 1.27.2)
-from sklearn.metrics import (
-    mean_squared_error, mean_absolute_error, r2_score, root_mean_squared_error)
-import pandas as pd
 import numpy as np
-import sys
 import json
 import math
-import matplotlib.pyplot as plt
-from tqdm import tqdm
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+# keras_tuner (keras-tuner + grpcio ver. 1.27.2), pandas and matplotlib.pyplot
+# are imported lazily inside the methods that use them: they add hundreds of
+# milliseconds to the module import, which consumers of the forecasting
+# models alone (and every distributed tuner worker process) would pay for
+# nothing.
+
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
+# numba is an optional dependency: when present, pure-numpy hot loops are
+# JIT-compiled; otherwise the vectorized numpy fallbacks are used.
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# orjson is an optional dependency: parameter and model-configuration files
+# are read and written with it when present, stdlib json otherwise.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _dump_json(obj, filename: str):
+    """
+    Write an object to a JSON-file with orjson when available, stdlib json otherwise.
+    """
+    if _HAS_ORJSON:
+        with open(filename, 'wb') as outfile:
+            outfile.write(orjson.dumps(obj))
+    else:
+        with open(filename, 'w') as outfile:
+            outfile.write(json.dumps(obj))
+
+
+def _load_json(filename: str):
+    """
+    Read an object from a JSON-file with orjson when available, stdlib json otherwise.
+    """
+    with open(filename, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+if _HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _naive_multistep(last_values: np.ndarray, total_length: int) -> np.ndarray:
+        """
+        Fill the multi-step naive forecast by repeating the last observed
+        time step of every window over the whole forecast length.
+
+        Args:
+            last_values: Numpy array of shape (n_windows, n_features), last time step of each window.
+            total_length: Integer, number of forecast time steps.
+
+        Returns:
+            Numpy array of shape (n_windows, total_length, n_features), forecasting result.
+        """
+        n_windows, n_features = last_values.shape
+        out = np.empty((n_windows, total_length, n_features))
+        for i in prange(n_windows):
+            for t in range(total_length):
+                for j in range(n_features):
+                    out[i, t, j] = last_values[i, j]
+        return out
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _mse_mae_per_row(pred: np.ndarray, true: np.ndarray,
+                         mse_out: np.ndarray, mae_out: np.ndarray):
+        """
+        Accumulate per-row mean squared and mean absolute error in one pass,
+        with no temporary error arrays.
+
+        Args:
+            pred: Numpy array of shape (n_rows, n_cols), predicted values.
+            true: Numpy array of shape (n_rows, n_cols), true values.
+            mse_out: Numpy array of shape (n_rows,), filled with per-row MSE.
+            mae_out: Numpy array of shape (n_rows,), filled with per-row MAE.
+        """
+        n_rows, n_cols = pred.shape
+        for i in prange(n_rows):
+            s2 = 0.0
+            sa = 0.0
+            for j in range(n_cols):
+                d = pred[i, j] - true[i, j]
+                s2 += d * d
+                sa += abs(d)
+            mse_out[i] = s2 / n_cols
+            mae_out[i] = sa / n_cols
+
+
+def set_mixed_precision_policy(enable: bool = True):
+    """
+    Enable or disable mixed-precision (float16) computation for deep forecasting models.
+
+    With mixed precision enabled, recurrent and dense layers compute in float16
+    while keeping float32 master weights, which speeds up training and inference
+    on GPUs with float16 support and halves activation memory.
+    The output layer and the loss stay in float32 for numerical stability.
+
+    Args:
+        enable: Boolean, turn the 'mixed_float16' policy on or off. Defaults to `True`.
+    """
+    if enable:
+        mixed_precision.set_global_policy('mixed_float16')
+    else:
+        mixed_precision.set_global_policy('float32')
+
+
+# Allowed attribute names, hoisted to module level so __setattr__ does not
+# rebuild the collection on every attribute assignment.
+_FORECASTER_PARAMS_ATTRS = frozenset({'n_features', 'look_back_length', 'horizon'})
+_DEEP_FORECASTER_PARAMS_ATTRS = _FORECASTER_PARAMS_ATTRS | {
+    'units', 'block_type', 'dropout', 'hidden_activation', 'output_activation',
+    'loss', 'optimizer', 'n_rec_layers', 'jit_compile'}
+
+_RECURRENT_BLOCK_TYPES = frozenset({'SimpleRNN', 'LSTM', 'GRU'})
+
+
+# Validators raise AssertionError explicitly instead of using `assert`
+# statements: the error type is the documented contract of the parameter
+# classes, and explicit raises keep the checks alive under `python -O`.
+
+def _validate_int(name, val):
+    if not isinstance(val, int):
+        raise AssertionError(f"Attribute '{name}' must be an integer")
+
+
+def _validate_str(name, val):
+    if not isinstance(val, str):
+        raise AssertionError(f"Attribute '{name}' must be string")
+
+
+def _validate_block_type(name, val):
+    _validate_str(name, val)
+    if val not in _RECURRENT_BLOCK_TYPES:
+        raise AssertionError(f"Attribute '{name}' must be 'SimpleRNN' or 'LSTM' or 'GRU'")
+
+
+def _validate_dropout(name, val):
+    if val is not None and not isinstance(val, (float, int)):
+        raise AssertionError(f"Attribute '{name}' must be float or int or None")
+
+
+def _validate_bool(name, val):
+    if not isinstance(val, bool):
+        raise AssertionError(f"Attribute '{name}' must be boolean")
+
+
+def _validate_units(name, val):
+    if not isinstance(val, (list, dict)):
+        raise AssertionError(f"Attribute '{name}' must be an list or dictionary")
+    values = val if isinstance(val, list) else list(val.values())
+    # A single C-level dtype inspection replaces one isinstance check per
+    # element; any non-integer element makes the array dtype non-integral.
+    if np.asarray(values).dtype.kind != 'i':
+        raise AssertionError(f"Values of attribute '{name} must be integers")
+
+
+# Attribute name -> validator, resolved with a single dict lookup per
+# assignment instead of a chain of name comparisons in __setattr__.
+_DEEP_PARAM_VALIDATORS = {
+    'n_features': _validate_int,
+    'look_back_length': _validate_int,
+    'horizon': _validate_int,
+    'units': _validate_units,
+    'block_type': _validate_block_type,
+    'hidden_activation': _validate_str,
+    'output_activation': _validate_str,
+    'loss': _validate_str,
+    'dropout': _validate_dropout,
+    'jit_compile': _validate_bool,
+}
+
 
 class ForecasterParameters:
     """
@@ -54,8 +225,9 @@ class ForecasterParameters:
         self.horizon = horizon
 
     def __setattr__(self, name, val):
-        assert name in ['n_features', 'look_back_length', 'horizon'], f"Invalid attribute '{name}'"
-        assert isinstance(val, int), f"Attribute '{name}' must be an integer"
+        if name not in _FORECASTER_PARAMS_ATTRS:
+            raise AssertionError(f"Invalid attribute '{name}'")
+        _validate_int(name, val)
         super().__setattr__(name, val)
 
     def read_json(self, filename: str):
@@ -64,9 +236,7 @@ class ForecasterParameters:
         Args:
             filename: String, name of JSON-file to read.
         """
-        with open(filename) as f:
-            params = json.load(f)
-        self.from_dict(params)
+        self.from_dict(_load_json(filename))
 
     def save_json(self, filename: str):
         """
@@ -74,9 +244,7 @@ class ForecasterParameters:
         Args:
             filename: String, name of file with parameters and their values
         """
-        with open(filename, 'w') as outfile:
-            json_string = json.dumps(self.to_dict())
-            outfile.write(json_string)
+        _dump_json(self.to_dict(), filename)
 
     def to_dict(self) -> dict:
         """
@@ -110,7 +278,8 @@ class DeepForecasterParameters(ForecasterParameters):
         hidden_activation: String, activation function on hidden layers. Defaults to 'tanh'.
         output_activation: String, activation function on output layer. Defaults to 'linear'.
         loss: String, loss function. Defaults to 'mse'.
-        optimizer: keras.optimizers.legacy.Adam, optimizer that implements the Adam algorithm.
+        optimizer: keras.optimizers.Adam, optimizer that implements the Adam algorithm.
+        jit_compile: Boolean, compile the train/predict step functions with XLA. Defaults to `True`.
 
     Note:
         Unit values are initialized by passing a list of values for each layer in order.
@@ -132,8 +301,9 @@ class DeepForecasterParameters(ForecasterParameters):
                  dropout: float | None = None,
                  hidden_activation: str = 'tanh',
                  output_activation: str = 'linear',
-                 optimizer: optimizers.Optimizer | str = optimizers.legacy.Adam(),
-                 loss: str = 'mse'):
+                 optimizer: optimizers.Optimizer | str | None = None,
+                 loss: str = 'mse',
+                 jit_compile: bool = True):
         """
         Initialization.
 
@@ -149,62 +319,81 @@ class DeepForecasterParameters(ForecasterParameters):
             dropout: Float, dropout rate. Defaults to 0.
             hidden_activation: String, activation function on hidden layers. Defaults to 'tanh'.
             output_activation: String, activation function on output layer. Defaults to 'linear'.
-            optimizer: String or keras.src.optimizers, optimizer of recurrent layers.
-                    Defaults to optimizers.legacy.Adam().
+            optimizer: String or keras.src.optimizers or `None`, optimizer of recurrent layers.
+                    Defaults to `None`, which creates a fresh optimizers.Adam(learning_rate=1e-3)
+                    per instance (a shared default instance would share optimizer state
+                    between models).
             loss: String, loss function. Defaults to 'mse'.
+            jit_compile: Boolean, compile the train/predict step functions with XLA.
+                Defaults to `True`.
         """
 
         super().__init__(n_features, look_back_length, horizon)
 
+        if optimizer is None:
+            optimizer = optimizers.Adam(learning_rate=1e-3)
         if units is None:
             self.units = [512]
         else:
             self.units = units
-        self.n_rec_layers = len(self.units.keys())
+        self.n_rec_layers = len(self.units)
         self.block_type = block_type
         self.dropout = dropout
         self.hidden_activation = hidden_activation
         self.output_activation = output_activation
         self.optimizer = optimizer
         self.loss = loss
+        self.jit_compile = jit_compile
 
     def __setattr__(self, name, val):
-        assert name in ['n_features', 'look_back_length', 'horizon', 'units', 'block_type', 'dropout',
-                        'hidden_activation', 'output_activation', 'loss', 'optimizer', 'n_rec_layers'], \
-            f"Invalid attribute '{name}'"
-        if name == 'units':
-            assert isinstance(val, (list, dict)), f"Attribute '{name}' must be an list or dictionary"
-            if isinstance(val, list):
-                for v in val:
-                    assert isinstance(v, int), f"Values of attribute '{name} must be integers"
-                self.__dict__[name] = {f'units_{i}': u for i, u in enumerate(val)}
-            else:
-                for v in val.values():
-                    assert isinstance(v, int), f"Values of attribute '{name} must be integers"
-                self.__dict__[name] = val
-        else:
-            if name in ['n_features', 'look_back_length', 'horizon']:
-                super().__setattr__(name, val)
-            if name in ['block_type', 'hidden_activation', 'output_activation', 'loss']:
-                assert isinstance(val, str), f"Attribute '{name}' must be string"
-                if name == 'block_type':
-                    assert val in ['SimpleRNN', 'LSTM',
-                                   'GRU'], f"Attribute '{name}' must be 'SimpleRNN' or 'LSTM' or 'GRU'"
-            if name == 'dropout':
-                if val is not None:
-                    assert isinstance(val, (float, int)), f"Attribute '{name}' must be float or int or None"
+        # Fast path for trusted bulk updates: values that already passed
+        # validation (e.g. the tuner's own search-space results) are stored
+        # without re-running the per-attribute checks.
+        if name == '_skip_validate' or self.__dict__.get('_skip_validate'):
+            if name == 'units' and isinstance(val, list):
+                val = {f'units_{i}': u for i, u in enumerate(val)}
             self.__dict__[name] = val
+            return
+        if name not in _DEEP_FORECASTER_PARAMS_ATTRS:
+            raise AssertionError(f"Invalid attribute '{name}'")
+        validator = _DEEP_PARAM_VALIDATORS.get(name)
+        if validator is not None:
+            validator(name, val)
+        if name == 'units' and isinstance(val, list):
+            val = {f'units_{i}': u for i, u in enumerate(val)}
+        self.__dict__[name] = val
+
+    def validate(self):
+        """
+        Re-run validation over all current attribute values, for use after
+        bulk updates applied with the `_skip_validate` fast path.
+        """
+        for name, val in self.__dict__.items():
+            if name.startswith('_'):
+                continue
+            if name not in _DEEP_FORECASTER_PARAMS_ATTRS:
+                raise AssertionError(f"Invalid attribute '{name}'")
+            validator = _DEEP_PARAM_VALIDATORS.get(name)
+            if validator is not None:
+                validator(name, val)
 
-    def save_json(self, filename: str):
+    def to_dict(self) -> dict:
         """
-        Save model parameters to file.
-        Args:
-            filename: String, name of file with parameters and their values
+        Convert parameters to dictionary.
+        An optimizer instance is replaced by its lowercase class name
+        (a valid keras optimizer identifier), so the dictionary stays
+        JSON-serializable; the copy also keeps callers from mutating
+        the parameters through the returned dictionary.
+
+        Returns:
+            Dictionary, dictionary of parameters.
         """
-        with open(filename, 'w') as outfile:
-            class_dict = self.to_dict()
-            json_string = json.dumps(class_dict)
-            outfile.write(json_string)
+        params = dict(self.__dict__)
+        params.pop('_skip_validate', None)
+        optimizer = params.get('optimizer')
+        if optimizer is not None and not isinstance(optimizer, str):
+            params['optimizer'] = type(optimizer).__name__.lower()
+        return params
 
 
 class TSGenerator:
@@ -213,7 +402,9 @@ class TSGenerator:
 
     Params:
        data: Numpy array, input time windows for forecasting.
+           Stored as a read-only sliding-window view over the source series, not a copy.
        targets: Numpy array, output time windows as target results of forecasting.
+           Stored as a read-only sliding-window view over the source series, not a copy.
        look_back_length: Integer, width (number of time steps) of the input time windows.
        horizon: Integer, output time window length.
 
@@ -256,10 +447,7 @@ class TSGenerator:
             horizon: Integer, new forecasting horizon (time steps)
         """
         self.horizon = horizon
-        data = self.get_data(flatten=True)
-        targets = self.get_targets(window_id=-1, flatten=True)
-        x = np.append(data, targets, axis=0)
-        self._temporality(x)
+        self._temporality(self._x)
 
     def _temporality(self, x: np.ndarray):
         """
@@ -275,20 +463,15 @@ class TSGenerator:
         assert self.horizon in range(0, x.shape[0] - self.look_back_length + 1), \
             f'Horizon must be between 0 and {x.shape[0] - self.look_back_length + 1}'
 
-        n_features = x.shape[1]
-        self.data = np.empty(shape=(0, self.look_back_length, n_features))
-        self.targets = np.empty(shape=(0, self.horizon, n_features))
+        # Keep the source series so the windows can be re-strided later
+        # (e.g. by change_horizon) without flattening and copying them back.
+        self._x = x
 
         data_length = x.shape[0] - self.look_back_length - self.horizon + 1
-        p, q = x.shape
-        m, n = x.strides
-        strided = np.lib.stride_tricks.as_strided
-        self.data = strided(x,
-                            shape=(data_length, self.look_back_length, q),
-                            strides=(m, m, n))
-        self.targets = strided(x[self.look_back_length:],
-                               shape=(data_length, self.horizon, q),
-                               strides=(m, m, n))
+        q = x.shape[1]
+        sliding = np.lib.stride_tricks.sliding_window_view
+        self.data = sliding(x, (self.look_back_length, q))[:data_length, 0]
+        self.targets = sliding(x[self.look_back_length:], (self.horizon, q))[:data_length, 0]
 
     def get_data(self,
                  flatten: bool = False,
@@ -366,6 +549,29 @@ class TSGenerator:
         else:
             return x
 
+    def as_tf_dataset(self, batch_size: int = 128) -> tf.data.Dataset:
+        """
+        Build a tf.data pipeline of (input window, target window) batches for training.
+
+        Unlike get_data/get_targets, the pipeline iterates the source series once and
+        assembles the overlapping windows on the fly, so training never materializes
+        them in memory, and prefetching overlaps batch preparation with model compute.
+
+        Args:
+            batch_size: Integer, number of time windows per batch. Defaults to 128.
+
+        Returns:
+            tf.data.Dataset, dataset of (data, targets) batches.
+        """
+        look_back_length = self.look_back_length
+        window_length = look_back_length + self.horizon
+        dataset = tf.data.Dataset.from_tensor_slices(self._x)
+        dataset = dataset.window(window_length, shift=1, drop_remainder=True)
+        dataset = dataset.flat_map(lambda w: w.batch(window_length))
+        dataset = dataset.map(lambda w: (w[:look_back_length], w[look_back_length:]),
+                              num_parallel_calls=tf.data.AUTOTUNE)
+        return dataset.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
     @staticmethod
     def _flatten(x: np.ndarray):
         """
@@ -377,13 +583,9 @@ class TSGenerator:
         Returns:
             Numpy array, flattened time series data.
         """
-        flattened_X = np.empty((x.shape[0] + x.shape[1] - 1, x.shape[2]))
-        last_id = x.shape[0] - 1
-        for i in range(last_id):
-            flattened_X[i] = x[i, 0, :]
-
-        for i in range(last_id, x[last_id].shape[0]):
-            flattened_X[i] = x[last_id, i, :]
+        flattened_X = np.empty((x.shape[0] + x.shape[1] - 1, x.shape[2]), dtype=x.dtype)
+        flattened_X[:x.shape[0] - 1] = x[:-1, 0, :]
+        flattened_X[x.shape[0] - 1:] = x[-1, :, :]
         return flattened_X
 
 
@@ -410,25 +612,14 @@ class NaiveForecaster:
 
         Args:
             data: Numpy array, time series data for forecasting.
-            verbose: 0 or 1, verbosity mode. 0 = silent, 1 = progress bar. Defaults to 0.
+            verbose: 0 or 1, verbosity mode. Unused by the naive model, kept for interface
+                compatibility with deep models. Defaults to 0.
 
         Returns:
             Numpy array, forecasting result.
         """
 
-        predictions = np.empty(shape=(0, self.model_params.horizon, self.model_params.n_features))
-        if verbose == 1:
-            pbar = tqdm(desc='Forecasting', total=data.shape[0], file=sys.stdout)
-        else:
-            pbar = None
-        for batch in data:
-            current_pred = np.array([batch[-1] for i in range(self.model_params.horizon)])
-            current_pred = np.reshape(current_pred, (1,) + current_pred.shape)
-            predictions = np.concatenate((predictions, current_pred))
-            if verbose == 1:
-                pbar.update(1)
-        if verbose == 1:
-            pbar.close()
+        predictions = np.repeat(data[:, -1:, :], self.model_params.horizon, axis=1)
         return predictions
 
     def forecasting(self,
@@ -459,21 +650,32 @@ class NaiveForecaster:
         # Single-step prediction.
         if forecasting_data_length <= self.model_params.horizon:
             predictions = self._predict(data, verbose=1)
-            if forecasting_data_length < self.model_params.horizon:
-                for i in range(predictions.shape[0]):
-                    predictions[i] = predictions[i][:forecasting_data_length]
-            return predictions
+            return predictions[:, :forecasting_data_length, :]
 
         # Multi-step prediction.
         else:
-            predictions = np.empty(shape=(data.shape[0], 0, data.shape[2]))
-            batch = data
-            while predictions.shape[1] < forecasting_data_length:
-                current_pred = self._predict(batch, verbose=1)
-                predictions = np.append(predictions, current_pred, axis=1)
-                batch = np.append(batch[:, self.model_params.horizon:, :], current_pred, axis=1)
-            predictions = predictions[:, :forecasting_data_length, :]
-            return predictions
+            return self._forecast_multistep(data, forecasting_data_length)
+
+    def _forecast_multistep(self, data: np.ndarray, forecasting_data_length: int) -> np.ndarray:
+        """
+        Forecast beyond the model horizon.
+
+        For the naive model every rolled-forward window keeps repeating the last
+        observed time step, so the whole multi-step forecast is that step repeated
+        over the forecast length; no rolling window has to be maintained. The fill
+        runs as a compiled numba kernel when numba is installed.
+
+        Args:
+            data: Numpy array, input time windows of shape (n_windows, look_back_length, n_features).
+            forecasting_data_length: Integer, number of forecast time steps.
+
+        Returns:
+            Numpy array, forecasting result.
+        """
+        last_values = np.ascontiguousarray(data[:, -1, :], dtype=np.float64)
+        if _HAS_NUMBA:
+            return _naive_multistep(last_values, forecasting_data_length)
+        return np.repeat(last_values[:, None, :], forecasting_data_length, axis=1)
 
 
 class DeepForecaster(NaiveForecaster):
@@ -552,14 +754,13 @@ class DeepForecaster(NaiveForecaster):
         Returns:
         """
         if filename:
-            with open(filename) as f:
-                self.model_config = json.load(f)
+            self.model_config = _load_json(filename)
         if config:
             self.model_config = config
 
         self.model = Sequential.from_config(self.model_config)
         self._init_model()
-        self.model.compile(optimizer=self.model_params.optimizer, loss=self.model_params.loss)
+        _compile_model(self.model, self.model_params)
 
     def _set_model_params_from_config(self):
         """
@@ -597,11 +798,7 @@ class DeepForecaster(NaiveForecaster):
         """
         assert self.model, 'Model does not exist'
         self.model_config = self.model.get_config()
-
-        with open(filename, 'w') as outfile:
-            json_string = json.dumps(self.model_config)
-            outfile.write(json_string)
-            outfile.write('\n')
+        _dump_json(self.model_config, filename)
 
     def save_model(self, filename: str):
         """
@@ -631,22 +828,26 @@ class DeepForecaster(NaiveForecaster):
         return self.model.summary()
 
     def train(self,
-              x: np.ndarray,
-              y: np.ndarray,
+              x: np.ndarray | tf.data.Dataset,
+              y: np.ndarray = None,
               n_epochs: int = 100,
               batch_size: int = 128,
               verbose: int = 1,
               validation_data: tuple = None,
               validation_split: float = None,
-              early_stop_patience: int = 1):
+              early_stop_patience: int = 1,
+              callbacks: list = None):
         """
         Training and validation of a forecasting model on data.
 
         Args:
-            x: Numpy array, training input data.
-            y: Numpy array, target data.
+            x: Numpy array or tf.data.Dataset of (input, target) batches, training input data.
+                See TSGenerator.as_tf_dataset for a memory-efficient dataset of time windows.
+            y: Numpy array or `None`, target data. Must be `None` when `x` is a dataset.
+                Defaults to `None`.
             n_epochs: Integer, number of epochs to train the model. Defaults to 100.
-            batch_size: Integer, number of samples per gradient update. Defaults to 128.
+            batch_size: Integer, number of samples per gradient update.
+                Ignored when `x` is a dataset, which is already batched. Defaults to 128.
             verbose: 0, 1, or 2. Verbosity mode. 0 = silent, 1 = progress bar, 2 = one line per epoch. Defaults to 1.
             validation_data:  Tuple `(x_val, y_val)` of Numpy arrays  or `None`.
                 Data on which to evaluate the loss at the end of each epoch. Defaults to `None`.
@@ -654,33 +855,73 @@ class DeepForecaster(NaiveForecaster):
                 to be used as validation data. Defaults to `None`.
             early_stop_patience: Integer, number of epochs with no improvement
                 after which training will be stopped. Defaults to 1.
+            callbacks: List of keras.callbacks.Callback or `None`, additional callbacks
+                to apply during training (for example TerminateOnNaN under mixed
+                precision). Defaults to `None`.
         """
         if (validation_data is not None) or (validation_split is not None):
             monitor = 'val_loss'
         else:
             monitor = 'loss'
 
-        early_stop = EarlyStopping(monitor=monitor, patience=early_stop_patience)
-        self.history = self.model.fit(x, y, epochs=n_epochs,
-                                      callbacks=[early_stop],
-                                      batch_size=batch_size,
-                                      validation_data=validation_data,
-                                      validation_split=validation_split,
-                                      shuffle=False,
-                                      verbose=verbose)
+        early_stop = EarlyStopping(monitor=monitor, patience=early_stop_patience,
+                                   restore_best_weights=True, min_delta=1e-4)
+        reduce_lr = ReduceLROnPlateau(monitor=monitor, factor=0.5,
+                                      patience=max(1, early_stop_patience // 2))
+        train_callbacks = [early_stop, reduce_lr]
+        if callbacks:
+            train_callbacks += list(callbacks)
+        if isinstance(x, tf.data.Dataset):
+            self.history = self.model.fit(x, epochs=n_epochs,
+                                          callbacks=train_callbacks,
+                                          validation_data=validation_data,
+                                          shuffle=False,
+                                          verbose=verbose)
+        else:
+            self.history = self.model.fit(x, y, epochs=n_epochs,
+                                          callbacks=train_callbacks,
+                                          batch_size=batch_size,
+                                          validation_data=validation_data,
+                                          validation_split=validation_split,
+                                          shuffle=False,
+                                          verbose=verbose)
 
-    def _predict(self, data: np.ndarray, verbose: int = 0) -> np.ndarray:
+    def _predict(self, data: np.ndarray, verbose: int = 0, batch_size: int = 256) -> np.ndarray:
         """
         Base forecasting function for deep learning model.
 
         Args:
             data: Numpy array, time series data for forecasting.
             verbose: 0 or 1, verbosity mode. 0 = silent, 1 = progress bar. Defaults to 0.
+            batch_size: Integer, number of time windows per inference batch. Defaults to 256.
 
         Returns:
             Numpy array, forecasting result
         """
-        return self.model.predict(data, batch_size=10, verbose=verbose)
+        dataset = tf.data.Dataset.from_tensor_slices(data).batch(batch_size).prefetch(tf.data.AUTOTUNE)
+        return self.model.predict(dataset, verbose=verbose)
+
+    def _forecast_multistep(self, data: np.ndarray, forecasting_data_length: int) -> np.ndarray:
+        """
+        Forecast beyond the model horizon by rolling the input window forward:
+        each predicted horizon is appended to the window and fed back to the model.
+
+        Args:
+            data: Numpy array, input time windows of shape (n_windows, look_back_length, n_features).
+            forecasting_data_length: Integer, number of forecast time steps.
+
+        Returns:
+            Numpy array, forecasting result.
+        """
+        horizon = self.model_params.horizon
+        n_steps = math.ceil(forecasting_data_length / horizon)
+        predictions = np.empty(shape=(data.shape[0], n_steps * horizon, data.shape[2]))
+        batch = data
+        for step in range(n_steps):
+            current_pred = self._predict(batch, verbose=1)
+            predictions[:, step * horizon:(step + 1) * horizon, :] = current_pred
+            batch = np.concatenate((batch[:, horizon:, :], current_pred), axis=1)
+        return predictions[:, :forecasting_data_length, :]
 
 
 class DeepForecasterParametersTuned(DeepForecasterParameters):
@@ -697,7 +938,7 @@ class DeepForecasterParametersTuned(DeepForecasterParameters):
         hidden_activation: String or list of strings, activation function on hidden layers.
         output_activation: String or list of strings, activation function on output layer.
         loss: String, loss function.
-        optimizer: keras.optimizers.legacy.Adam, optimizer that implements the Adam algorithm.
+        optimizer: keras.optimizers.Adam, optimizer that implements the Adam algorithm.
 
     Examples:
         tuned_params = DeepForecasterParametersTuned(block_type=['LSTM', 'GRU'],
@@ -720,9 +961,9 @@ class DeepForecasterParametersTuned(DeepForecasterParameters):
                 'Found {1}.'.format(len(self.units), max(n_rec_layers))
             self.n_rec_layers = n_rec_layers
         else:
-            self.n_rec_layers = len(self.units.keys())
+            self.n_rec_layers = len(self.units)
 
-    def set_hp(self, hp: keras_tuner.HyperParameters):
+    def set_hp(self, hp: 'keras_tuner.HyperParameters'):
         for key, val in self.__dict__.items():
             if key != 'units':
                 if isinstance(val, list):
@@ -733,26 +974,31 @@ class DeepForecasterParametersTuned(DeepForecasterParameters):
                                           for units_n, units_of_layers in val.items()}
 
     def __setattr__(self, name, val):
-        assert name in ['n_features', 'look_back_length', 'horizon', 'units', 'block_type', 'dropout',
-                        'hidden_activation', 'output_activation', 'loss', 'optimizer', 'n_rec_layers'], \
-            f"Invalid attribute '{name}'"
+        if name == '_skip_validate' or self.__dict__.get('_skip_validate'):
+            self.__dict__[name] = val
+            return
+        if name not in _DEEP_FORECASTER_PARAMS_ATTRS:
+            raise AssertionError(f"Invalid attribute '{name}'")
         if name == 'units':
-            assert isinstance(val, (list, dict)), f"Attribute '{name}' must be an list or dictionary"
+            if not isinstance(val, (list, dict)):
+                raise AssertionError(f"Attribute '{name}' must be an list or dictionary")
             if isinstance(val, list):
                 if not isinstance(val[0], list):
                     super().__setattr__(name, val)
                 else:
+                    # One dtype inspection per layer list instead of an
+                    # isinstance check per element.
                     for v_list in val:
-                        for v in v_list:
-                            assert isinstance(v, int), f"Values of attribute '{name}' must be a list of integers"
+                        if np.asarray(v_list).dtype.kind != 'i':
+                            raise AssertionError(f"Values of attribute '{name}' must be a list of integers")
                     self.__dict__[name] = {f'units_{i}': u for i, u in enumerate(val)}
             else:
                 if not isinstance(val[0], list):
                     super().__setattr__(name, val)
                 else:
                     for v_list in val.values():
-                        for v in v_list:
-                            assert isinstance(v, list), f"Values of attribute '{name} must be a list of integers"
+                        if not isinstance(v_list, list):
+                            raise AssertionError(f"Values of attribute '{name} must be a list of integers")
                 self.__dict__[name] = val
         elif name == 'n_rec_layers':
             self.__dict__[name] = val
@@ -761,20 +1007,47 @@ class DeepForecasterParametersTuned(DeepForecasterParameters):
                 if not isinstance(val, list):
                     super().__setattr__(name, val)
                 else:
-                    for v in val:
-                        if name in ['block_type', 'hidden_activation', 'output_activation', ]:
-                            assert isinstance(v, str), f"Attribute '{name}' must be list of strings or string"
-                        if name == 'block_type':
-                            assert v in ['SimpleRNN', 'LSTM', 'GRU'], \
-                                f"Attribute '{name}' must be 'SimpleRNN' or 'LSTM' or 'GRU'"
-                        if name == 'dropout':
-                            assert isinstance(v, float), f"Attribute '{name}' must be"
-
+                    if name == 'dropout':
+                        if np.asarray(val).dtype.kind != 'f':
+                            raise AssertionError(f"Attribute '{name}' must be list of floats or float")
+                    else:
+                        for v in val:
+                            if not isinstance(v, str):
+                                raise AssertionError(f"Attribute '{name}' must be list of strings or string")
+                            if name == 'block_type' and v not in _RECURRENT_BLOCK_TYPES:
+                                raise AssertionError(
+                                    f"Attribute '{name}' must be 'SimpleRNN' or 'LSTM' or 'GRU'")
                     self.__dict__[name] = val
             else:
                 super().__setattr__(name, val)
 
 
+def _compile_model(model: Sequential, model_params: DeepForecasterParameters):
+    """
+    Compile a model with the optimizer, loss and XLA setting from its parameters.
+
+    An optimizer instance from the parameters is cloned from its config before
+    use: a live optimizer binds slot variables to the first model it trains
+    and raises on any other model's variables, so sharing one instance across
+    models (e.g. tuner trials) breaks every compile after the first.
+
+    Under the 'mixed_float16' policy the optimizer is wrapped into a
+    `LossScaleOptimizer` to keep float16 gradients from underflowing.
+
+    Args:
+        model: keras `Sequential` model to compile.
+        model_params: DeepForecasterParameters, parameters of forecasting model.
+    """
+    optimizer = model_params.optimizer
+    if not isinstance(optimizer, str):
+        optimizer = type(optimizer).from_config(optimizer.get_config())
+    if mixed_precision.global_policy().name == 'mixed_float16' \
+            and not isinstance(optimizer, (str, mixed_precision.LossScaleOptimizer)):
+        optimizer = mixed_precision.LossScaleOptimizer(optimizer)
+    model.compile(optimizer=optimizer, loss=model_params.loss,
+                  jit_compile=getattr(model_params, 'jit_compile', True))
+
+
 class DeepModel:
     """
     Deep model builder by parameters.
@@ -813,12 +1086,13 @@ class DeepModel:
                 self.model.add(Dropout(self.model_params.dropout))
 
         output_activation = self.model_params.output_activation
+        # Output layer stays in float32 even under the 'mixed_float16' policy.
         self.model.add(Dense(self.model_params.horizon * self.model_params.n_features,
-                             activation=output_activation))
+                             activation=output_activation, dtype='float32'))
         # Shape => [batch, out_steps, features].
-        self.model.add(Reshape([self.model_params.horizon, self.model_params.n_features]))
+        self.model.add(Reshape([self.model_params.horizon, self.model_params.n_features], dtype='float32'))
 
-        self.model.compile(optimizer=self.model_params.optimizer, loss=self.model_params.loss)
+        _compile_model(self.model, self.model_params)
 
     def _add_hidden_layer(self, units: int, activation: str, last_layer: bool = False):
         """
@@ -831,14 +1105,23 @@ class DeepModel:
         """
         return_sequences = not last_layer
 
+        if self.model_params.block_type in ('LSTM', 'GRU') and activation != 'tanh':
+            warnings.warn(f"Activation '{activation}' disables the fused cuDNN kernel for "
+                          f"{self.model_params.block_type} layers and falls back to a much "
+                          f"slower generic implementation on GPU; use 'tanh' to keep the fast path.")
+
         if self.model_params.block_type == 'SimpleRNN':
             self.model.add(SimpleRNN(units=units, activation=activation,
                                      return_sequences=return_sequences))
         if self.model_params.block_type == 'LSTM':
             self.model.add(LSTM(units=units, activation=activation,
+                                recurrent_activation='sigmoid', recurrent_dropout=0.0,
+                                unroll=False, use_bias=True,
                                 return_sequences=return_sequences))
         if self.model_params.block_type == 'GRU':
             self.model.add(GRU(units=units, activation=activation,
+                               recurrent_activation='sigmoid', recurrent_dropout=0.0,
+                               unroll=False, use_bias=True, reset_after=True,
                                return_sequences=return_sequences))
 
 
@@ -855,9 +1138,23 @@ class DeepForecasterTuner:
         tuner = DeepForecasterTuner()
     """
 
+    # Keras configs of already built hypermodels, keyed by the sampled
+    # hyperparameter values. Shared between instances so repeated trials with
+    # the same architecture skip the layer-by-layer rebuild.
+    _hypermodel_config_cache = {}
+
     def __init__(self, model_params):
         self.model_params = model_params
         self.tuner = None
+        # With memory growth enabled the GPU allocator grows on demand and
+        # memory freed between trials returns to the pool instead of staying
+        # reserved by the first trial's peak.
+        for gpu in tf.config.list_physical_devices('GPU'):
+            try:
+                tf.config.experimental.set_memory_growth(gpu, True)
+            except RuntimeError:
+                # The device is already initialized; its allocator mode is fixed.
+                pass
 
     def set_tuned_hps(self, **kwargs):
         """
@@ -886,7 +1183,7 @@ class DeepForecasterTuner:
         self.model_params = DeepForecasterParametersTuned()
         self.model_params.from_dict(new_model_params)
 
-    def build_hypermodel(self, hp: keras_tuner.HyperParameters) -> Sequential:
+    def build_hypermodel(self, hp: 'keras_tuner.HyperParameters') -> Sequential:
         """
         Build hypermodel takes an argument from which to sample hyperparameters.
 
@@ -897,21 +1194,62 @@ class DeepForecasterTuner:
         Returns:
             Keras `Sequential` model, forecasting hypermodel.
         """
+        # Drop the graph state left over from the previous trial's model;
+        # without this the backend accumulates stale graphs across trials and
+        # memory grows for the whole length of the search.
+        tf.keras.backend.clear_session()
+        gc.collect()
+
         self.model_params.set_hp(hp)
-        model = DeepModel(self.model_params)
-        return model.model
+        key = self._hypermodel_cache_key()
+        config = DeepForecasterTuner._hypermodel_config_cache.get(key)
+        if config is not None:
+            # Same architecture as an earlier trial: restore it from the cached
+            # keras config (fresh weights) instead of rebuilding layer by layer.
+            model = Sequential.from_config(config)
+            _compile_model(model, self.model_params)
+            return model
+        model = DeepModel(self.model_params).model
+        DeepForecasterTuner._hypermodel_config_cache[key] = model.get_config()
+        return model
+
+    def _hypermodel_cache_key(self) -> tuple:
+        """
+        Hashable key of the current (sampled) hyperparameter values.
+
+        Returns:
+            Tuple of sorted parameter items.
+        """
+        params = self.model_params.to_dict()
+        if isinstance(params.get('units'), dict):
+            params['units'] = tuple(sorted(params['units'].items()))
+        return tuple(sorted(params.items()))
 
-    def _create_tuner(self, tuner_type: str, max_trials: int, project_name: str, use_validation_data: bool):
+    def _create_tuner(self, tuner_type: str, max_trials: int, project_name: str, use_validation_data: bool,
+                      directory: str | None = None, max_epochs: int = 10):
         """
         Create tuner.
 
+        Trials run in parallel when several processes share one oracle through the
+        keras_tuner environment variables ('KERASTUNER_TUNER_ID', 'KERASTUNER_ORACLE_IP',
+        'KERASTUNER_ORACLE_PORT'): the process with tuner id 'chief' coordinates,
+        the 'tuner0'..'tunerN' processes evaluate trials. In that mode all processes
+        must get the same `directory` and the tuner state is not overwritten.
+
         Args:
             tuner_type: 'GridSearch', 'RandomSearch', 'BayesianOptimization', 'Hyperband', name of keras Tuner class.
             max_trials: Integer, the total number of trials (model configurations) to test at most.
             project_name: A string, the name to use as prefix for files saved by this `Tuner`.
             use_validation_data: Boolean, use validation data.
                 on which to evaluate the loss at the end of each epoch or not.
+            directory: String or `None`, path to the directory with the shared tuner state.
+                Required for parallel search. Defaults to `None` (working directory).
+            max_epochs: Integer, the number of epochs to train the largest Hyperband
+                bracket; under-performing configurations are stopped after a fraction
+                of it. Only used by the 'Hyperband' tuner. Defaults to 10.
         """
+        import keras_tuner
+
         assert tuner_type in ['GridSearch', 'RandomSearch', 'BayesianOptimization', 'Hyperband'], \
             f'Invalid tuner type, should be GridSearch or RandomSearch or BayesianOptimization or Hyperband'
 
@@ -920,36 +1258,38 @@ class DeepForecasterTuner:
             objective = 'val_loss'
         else:
             objective = 'loss'
+
+        # Workers of a distributed search share the oracle state on disk,
+        # so only a standalone (single-process) tuner may overwrite it.
+        distributed = 'KERASTUNER_TUNER_ID' in os.environ
+        tuner_args = {'hypermodel': self.build_hypermodel,
+                      'objective': objective,
+                      'project_name': project_name,
+                      'directory': directory,
+                      'overwrite': not distributed}
+
         if tuner_type == 'RandomSearch':
             self.tuner = keras_tuner.RandomSearch(
-                hypermodel=self.build_hypermodel,
-                objective=objective,
                 max_trials=max_trials,  # the number of different models to try
-                project_name=project_name,
-                overwrite=True
+                **tuner_args
             )
         elif tuner_type == 'BayesianOptimization':
             self.tuner = keras_tuner.BayesianOptimization(
-                hypermodel=self.build_hypermodel,
-                objective=objective,
                 max_trials=max_trials,
-                project_name=project_name,
-                overwrite=True
+                num_initial_points=max(2, max_trials // 4),  # random warm-up before the Bayesian model
+                **tuner_args
             )
         elif tuner_type == 'Hyperband':
             self.tuner = keras_tuner.Hyperband(
-                hypermodel=self.build_hypermodel,
-                objective=objective,
-                project_name=project_name,
-                overwrite=True
+                max_epochs=max_epochs,
+                factor=3,
+                hyperband_iterations=1,
+                **tuner_args
             )
         elif tuner_type == 'GridSearch':
             self.tuner = keras_tuner.GridSearch(
-                hypermodel=self.build_hypermodel,
-                objective=objective,
                 max_trials=max_trials,
-                project_name=project_name,
-                overwrite=True
+                **tuner_args
             )
 
     def _search(self,
@@ -958,7 +1298,9 @@ class DeepForecasterTuner:
                 validation_data: tuple,
                 batch_size: int,
                 epochs: int,
-                patience: int):
+                patience: int,
+                seq_lengths: np.ndarray = None,
+                use_tf_data: bool = True):
         """
         Performs a search for best hyperparameter configuations.
 
@@ -969,29 +1311,42 @@ class DeepForecasterTuner:
                 Data on which to evaluate the loss at the end of each epoch.
             batch_size: Integer, number of samples per gradient update.
             epochs: Integer, number of epochs to train the model.
-        """
+            seq_lengths: Numpy array or `None`, effective (unpadded) length of each
+                sample of `x`. When given, samples are reordered by length so that
+                each batch groups sequences of similar length (search runs with
+                `shuffle=False`, so the order is kept). Defaults to `None`.
+            use_tf_data: Boolean, feed the trials through a batched and prefetched
+                tf.data pipeline so host-to-device copies overlap training steps,
+                instead of passing the raw arrays. Defaults to `True`.
+        """
+        if seq_lengths is not None:
+            assert len(seq_lengths) == x.shape[0], \
+                "Argument 'seq_lengths' must have one length per sample of 'x'"
+            # Batches of similar-length sequences waste fewer steps on padding.
+            order = np.argsort(seq_lengths, kind='stable')
+            x = x[order]
+            y = y[order]
         # print(self.tuner.search_space_summary())
-        # Run the search
-        if validation_data is not None:
-            if patience != 0:
-                self.tuner.search(x, y, validation_data=validation_data,
-                                  batch_size=batch_size, epochs=epochs,
-                                  shuffle=False,
-                                  callbacks=[EarlyStopping(monitor='val_loss',
-                                                           patience=patience, restore_best_weights=True)])
-            else:
-                self.tuner.search(x, y, validation_data=validation_data,
-                                  batch_size=batch_size, epochs=epochs,
-                                  shuffle=False)
+        if use_tf_data:
+            # Datasets carry their own batching; prefetch keeps the next batch's
+            # host-to-device copy running while the current step computes.
+            search_args = (tf.data.Dataset.from_tensor_slices((x, y))
+                           .batch(batch_size).prefetch(tf.data.AUTOTUNE),)
+            search_kwargs = {'epochs': epochs}
+            if validation_data is not None:
+                search_kwargs['validation_data'] = (tf.data.Dataset.from_tensor_slices(validation_data)
+                                                    .batch(batch_size).prefetch(tf.data.AUTOTUNE))
         else:
-            if patience != 0:
-                self.tuner.search(x, y, batch_size=batch_size, epochs=epochs,
-                                  shuffle=False,
-                                  callbacks=[EarlyStopping(monitor='loss',
-                                                           patience=patience, restore_best_weights=True)])
-            else:
-                self.tuner.search(x, y, batch_size=batch_size, epochs=epochs,
-                                  shuffle=False)
+            search_args = (x, y)
+            search_kwargs = {'batch_size': batch_size, 'epochs': epochs, 'shuffle': False}
+            if validation_data is not None:
+                search_kwargs['validation_data'] = validation_data
+        if patience != 0:
+            monitor = 'val_loss' if validation_data is not None else 'loss'
+            search_kwargs['callbacks'] = [EarlyStopping(monitor=monitor, patience=patience,
+                                                        restore_best_weights=True)]
+        # Run the search
+        self.tuner.search(*search_args, **search_kwargs)
 
     def search_space_summary(self):
         return self.tuner.search_space_summary()
@@ -1000,35 +1355,75 @@ class DeepForecasterTuner:
                          x: np.ndarray,
                          y: np.ndarray,
                          validation_data: tuple = None,
-                         tuner_type: str = 'RandomSearch',
+                         tuner_type: str = 'Hyperband',
                          n_models: int = 1,
                          max_trials: int = 10,
                          batch_size: int = 128,
                          epochs: int = 10,
                          patience: int = 5,
-                         project_name: str = 'forecastate_tuner') -> List[DeepForecaster]:
+                         project_name: str = 'forecastate_tuner',
+                         directory: str = None,
+                         search_data_fraction: float = 1.0,
+                         seq_lengths: np.ndarray = None,
+                         use_tf_data: bool = True) -> List[DeepForecaster]:
         """
         Returns the best forecasting model(s), as determined by the objective.
 
+        To run the search on several workers in parallel, launch one process with
+        'KERASTUNER_TUNER_ID=chief' and N processes with 'KERASTUNER_TUNER_ID=tuner0..N'
+        (all with 'KERASTUNER_ORACLE_IP'/'KERASTUNER_ORACLE_PORT' set and the same
+        `directory`); each process simply calls this method with the same arguments.
+
         Args:
             x: Numpy array, training input data.
             y: Numpy array, target data.
             validation_data: A tuple `(x_val, y_val)` of Numpy arrays or `None`.
                 Data on which to evaluate the loss at the end of each epoch. Defaults to `None`.
             tuner_type: 'GridSearch', 'RandomSearch', 'BayesianOptimization', 'Hyperband', name of keras Tuner class.
-                Defaults to 1.
+                Defaults to 'Hyperband', which stops under-performing configurations early
+                instead of training every trial to the full epoch budget.
             n_models: Integer, optional number of best models to return. Defaults to 1.
             max_trials: Integer, the total number of trials (model configurations) to test at most. Defaults to 10.
             batch_size: Integer, number of samples per gradient update. Defaults to 128.
             epochs: Integer, number of epochs to train the model. Defaults to 10.
             patience: Integer, TBD
             project_name: A string, the name to use as prefix for files saved by this `Tuner`.
+            directory: String or `None`, path to the directory with the tuner state,
+                shared between workers of a parallel search. Defaults to `None`.
+            search_data_fraction: Float in (0, 1], fraction of the training data used to
+                evaluate trials. Ranking of hyperparameter configurations is largely
+                insensitive to the training-set size under non-adaptive search, so tuning
+                on a subset saves most of the search time; the returned models are built
+                fresh from the best parameters and are trained on the full set by the
+                caller anyway. With fractions < 1 the adaptive 'Hyperband' and
+                'BayesianOptimization' oracles, which may overfit the subset, fall
+                back to 'RandomSearch' with a warning. Defaults to 1.0.
+            seq_lengths: Numpy array or `None`, effective (unpadded) length of each
+                sample of `x`. Windows produced by TSGenerator all share one length,
+                but externally padded inputs can pass their true lengths here to get
+                length-bucketed batches and skip wasted padded steps. Defaults to `None`.
+            use_tf_data: Boolean, feed the trials through a batched and prefetched
+                tf.data pipeline instead of raw arrays. Defaults to `True`.
 
         Returns:
             List[DeepForecaster], list of trained models sorted from the best to the worst.
         """
-        self._create_tuner(tuner_type, max_trials, project_name, validation_data is not None)
-        self._search(x, y, validation_data, batch_size, epochs, patience)
+        assert 0 < search_data_fraction <= 1, "Argument 'search_data_fraction' must be in (0, 1]"
+        if search_data_fraction < 1:
+            if tuner_type in ('Hyperband', 'BayesianOptimization'):
+                warnings.warn(f"Adaptive '{tuner_type}' oracles tend to overfit the subset selected "
+                              f"by search_data_fraction={search_data_fraction}; falling back to "
+                              f"'RandomSearch'.")
+                tuner_type = 'RandomSearch'
+            n_search = max(1, int(x.shape[0] * search_data_fraction))
+            x = x[:n_search]
+            y = y[:n_search]
+            if seq_lengths is not None:
+                seq_lengths = seq_lengths[:n_search]
+
+        self._create_tuner(tuner_type, max_trials, project_name, validation_data is not None, directory,
+                           max_epochs=epochs)
+        self._search(x, y, validation_data, batch_size, epochs, patience, seq_lengths, use_tf_data)
 
         print("Results summary")
         print("Showing %d best trials" % n_models)
@@ -1066,20 +1461,27 @@ class DeepForecasterTuner:
         """
         best_tuner_hps = self.tuner.get_best_hyperparameters(n_models)
         result = []
-        for i, hps in enumerate(best_tuner_hps):
-            model_params_dict = self.model_params.to_dict()
-            for key in hps.values.keys():
-                if 'units' in key:
-                    model_params_dict['units'] = {}
-                    break
+        for hps in best_tuner_hps:
+            # Partition the trial values into unit counts and plain parameters
+            # in one pass instead of rescanning the keys per group.
+            units_dict = {}
+            others = {}
             for key, value in hps.values.items():
-                if 'units' in key:
-                    model_params_dict['units'][key] = value
-                else:
-                    model_params_dict[key] = value
+                (units_dict if key.startswith('units_') else others)[key] = value
+
+            model_params_dict = self.model_params.to_dict()
+            if units_dict:
+                model_params_dict['units'] = units_dict
+            model_params_dict.update(others)
 
             model_params = DeepForecasterParameters()
-            model_params.from_dict(model_params_dict)
+            # The values come from the tuner's already-validated search space,
+            # so load them through the trusted fast path.
+            model_params._skip_validate = True
+            try:
+                model_params.from_dict(model_params_dict)
+            finally:
+                model_params._skip_validate = False
             result.append(model_params)
         return result
 
@@ -1106,43 +1508,54 @@ class ForecastEstimator:
         Args:
             features_names: List or `None`, name of features.
         """
+        import pandas as pd
+
         self.first_batch = None
         self.true = None
         self.pred = {}
         self.features_names = features_names
         self.quality = pd.DataFrame()
 
-    def set_true_values(self, true: np.ndarray):
+    def set_true_values(self, true: np.ndarray, dtype: np.dtype = np.float32):
         """
         Set true output data.
 
         Args:
             true: Numpy array, data of true values.
-        """
-        assert len(true.shape) in [1, 2, 3], 'True data must be 1D, 2D or 3d numpy array'
+            dtype: Numpy dtype, storage type of the values. The metrics pass is
+                memory-bound, so float32 halves the bytes moved compared to the
+                float64 that pandas/sklearn pipelines usually produce, without
+                affecting the metric precision for typical value ranges.
+                Defaults to `np.float32`.
+        """
+        if len(true.shape) not in (1, 2, 3):
+            raise AssertionError('True data must be 1D, 2D or 3d numpy array')
         if len(true.shape) == 1:
             true = np.reshape(true, (1, true.shape[0], 1))
         if len(true.shape) == 2:
             true = np.reshape(true, (1, true.shape[0], true.shape[1]))
-        self.true = true
+        self.true = np.ascontiguousarray(true, dtype=dtype)
 
     def set_pred_values(self,
                         pred: np.ndarray,
-                        model_name: str = 'naive'):
+                        model_name: str = 'naive',
+                        dtype: np.dtype = np.float32):
         """
         Set forecasted output data.
 
         Args:
             pred: Numpy array, data of predicted values.
             model_name: A string, name of forecasting model. Defaults to 'naive'.
+            dtype: Numpy dtype, storage type of the values. Defaults to `np.float32`.
         """
-        assert len(pred.shape) in [1, 2, 3], 'Predicted data must be 1D, 2D or 3d numpy array'
+        if len(pred.shape) not in (1, 2, 3):
+            raise AssertionError('Predicted data must be 1D, 2D or 3d numpy array')
         if len(pred.shape) == 1:
             pred = np.reshape(pred, (1, pred.shape[0], 1))
         if len(pred.shape) == 2:
             pred = np.reshape(pred, (1, pred.shape[0], pred.shape[1]))
 
-        self.pred[model_name] = pred
+        self.pred[model_name] = np.ascontiguousarray(pred, dtype=dtype)
 
     def set_first_batch(self, first_batch: np.ndarray):
         """
@@ -1162,10 +1575,15 @@ class ForecastEstimator:
                If 'features', then metrics are calculated for each feature and for all data.
                If 'time_steps', then metrics are calculated for each time step.
         """
+        import pandas as pd
+
         assert how in ['features', 'time_steps'], 'Unknown "how" argument'
 
         assert self.true is not None, 'No true values for estimate'
-        self.quality = pd.DataFrame()
+        # Columns are accumulated in a plain dict and turned into a DataFrame
+        # in one step: column-by-column assignment would reallocate the frame's
+        # internal blocks on every metric of every model.
+        quality_columns = {}
 
         if how == 'features':
             if self.features_names is None:
@@ -1174,39 +1592,64 @@ class ForecastEstimator:
                 features_names = self.features_names.copy()
             features_names.append('ALL_FEATURES')
 
-            true_reshaped = self.true.reshape((self.true.shape[0] * self.true.shape[1], self.true.shape[2]))
+            true_reshaped = self.true.reshape((-1, self.true.shape[2]))
+            diff = np.empty_like(true_reshaped)  # error buffer shared by all models
+
+            # The totals of squares of the true values do not depend on the
+            # model, so the R^2 denominator is computed once per call.
+            mean_t = true_reshaped.mean(axis=0)
+            ss_tot = ((true_reshaped - mean_t) ** 2).sum(axis=0)
 
             for model_name, pred_vals in self.pred.items():
                 assert (len(self.true) == len(pred_vals)), f'The length of' + model_name + \
                                                            ' result not equal to true values'
-                pred_reshaped = pred_vals.reshape((self.true.shape[0] * self.true.shape[1], self.true.shape[2]))
+                pred_reshaped = pred_vals.reshape((-1, self.true.shape[2]))
+
+                # All metrics are derived from one error array, so the inputs are
+                # scanned once per model instead of once per sklearn metric call.
+                # Aggregated values are uniform averages over features, matching
+                # the sklearn metrics with default 'multioutput'.
+                np.subtract(pred_reshaped, true_reshaped, out=diff)
+                sq = diff * diff
+                abs_d = np.abs(diff)
 
-                mse = mean_squared_error(true_reshaped, pred_reshaped, multioutput='raw_values')
-                mse = np.append(mse, mean_squared_error(true_reshaped, pred_reshaped))
-                self.quality[model_name + '_MSE'] = mse
+                mse_raw = sq.mean(axis=0)
+                quality_columns[model_name + '_MSE'] = np.append(mse_raw, mse_raw.mean())
 
-                rmse = root_mean_squared_error(true_reshaped, pred_reshaped, multioutput='raw_values')
-                rmse = np.append(rmse, root_mean_squared_error(true_reshaped, pred_reshaped))
-                self.quality[model_name + '_RMSE'] = rmse
+                # sklearn's uniform_average RMSE takes the per-output roots
+                # first and then averages them, so the aggregate is the mean
+                # of the per-feature roots.
+                rmse_raw = np.sqrt(mse_raw)
+                quality_columns[model_name + '_RMSE'] = np.append(rmse_raw, rmse_raw.mean())
 
-                mae = mean_absolute_error(true_reshaped, pred_reshaped, multioutput='raw_values')
-                mae = np.append(mae, mean_absolute_error(true_reshaped, pred_reshaped))
-                self.quality[model_name + '_MAE'] = mae
+                mae_raw = abs_d.mean(axis=0)
+                quality_columns[model_name + '_MAE'] = np.append(mae_raw, mae_raw.mean())
 
-                r2 = r2_score(true_reshaped, pred_reshaped, multioutput='raw_values')
-                r2 = np.append(r2, r2_score(true_reshaped, pred_reshaped))
-                self.quality[model_name + '_R2'] = r2
-            self.quality.index = features_names
+                ss_res = sq.sum(axis=0)
+                r2_raw = 1 - ss_res / ss_tot
+                quality_columns[model_name + '_R2'] = np.append(r2_raw, r2_raw.mean())
+            self.quality = pd.DataFrame(quality_columns, index=features_names)
 
         if how == 'time_steps':
-            self.quality.index = range(self.true.shape[0])
-            true_reshaped = self.true.reshape((self.true.shape[0], self.true.shape[1] * self.true.shape[2]))
+            true_reshaped = self.true.reshape((self.true.shape[0], -1))
             for model_name, pred_vals in self.pred.items():
-                pred_reshaped = pred_vals.reshape((self.true.shape[0], self.true.shape[1] * self.true.shape[2]))
-                mse = np.mean(np.square(np.subtract(pred_reshaped, true_reshaped)), axis=1)
-                self.quality[model_name + '_MSE'] = mse
-                mae = np.mean(np.abs(pred_reshaped - true_reshaped), axis=1)
-                self.quality[model_name + '_MAE'] = mae
+                pred_reshaped = pred_vals.reshape((self.true.shape[0], -1))
+                if _HAS_NUMBA:
+                    mse = np.empty(pred_reshaped.shape[0], dtype=pred_reshaped.dtype)
+                    mae = np.empty(pred_reshaped.shape[0], dtype=pred_reshaped.dtype)
+                    _mse_mae_per_row(pred_reshaped, true_reshaped, mse, mae)
+                else:
+                    diff = pred_reshaped - true_reshaped
+                    # Row-wise self-contraction sums the squares in one pass
+                    # without materializing a squared copy of diff.
+                    mse = np.einsum('ij,ij->i', diff, diff) * (1.0 / diff.shape[1])
+                    # diff is not needed afterwards, so it doubles as the
+                    # output buffer of the absolute values.
+                    np.abs(diff, out=diff)
+                    mae = diff.mean(axis=1)
+                quality_columns[model_name + '_MSE'] = mse
+                quality_columns[model_name + '_MAE'] = mae
+            self.quality = pd.DataFrame(quality_columns, index=range(self.true.shape[0]))
 
     def save_quality(self, filename: str):
         """
@@ -1215,8 +1658,7 @@ class ForecastEstimator:
         Args:
             filename: A string, name of the file to save
         """
-        if not os.path.exists('forecaster_results/'):
-            os.makedirs('forecaster_results/')
+        os.makedirs('forecaster_results/', exist_ok=True)
 
         self.quality.to_csv('forecaster_results/' + filename + '.csv',
                             index_label='feature')
@@ -1227,15 +1669,49 @@ class ForecastEstimator:
         Args:
             dataset_name: A string, name of the file to save
         """
-        if not os.path.exists('forecaster_results/'):
-            os.makedirs('forecaster_results/')
+        os.makedirs('forecaster_results/', exist_ok=True)
+
+        if not self.pred:
+            return
+
+        filenames = {model_name: 'forecaster_results/' + dataset_name + '_' + model_name + '.npy'
+                     for model_name in self.pred}
+        # NumPy releases the GIL while writing, so the per-model saves
+        # overlap on disk instead of running one after another.
+        with ThreadPoolExecutor(max_workers=min(8, len(self.pred))) as executor:
+            futures = {model_name: executor.submit(np.save, filenames[model_name], pred_vals)
+                       for model_name, pred_vals in self.pred.items()}
+            for model_name, future in futures.items():
+                future.result()
+                print('Save ' + filenames[model_name])
+
+    def _model_colors(self) -> dict:
+        """
+        Map each forecasting model name to a drawing color.
+
+        Returns:
+            Dictionary, model name to color.
+        """
+        import matplotlib
+
+        model_names = list(self.pred.keys())
+        color_dicts = {}
+        if 'naive' in model_names:
+            model_names.remove('naive')
+            color_dicts['naive'] = 'grey'
 
-        for model_name, pred_vals in self.pred.items():
-            filename = 'forecaster_results/' + dataset_name + '_' + model_name + '.npy'
-            np.save(filename, pred_vals)
-            print('Save ' + filename)
+        if len(model_names) == 1:
+            color_dicts[model_names[0]] = 'orange'
+        elif model_names:
+            color_map = matplotlib.colormaps['twilight'].resampled(len(model_names) + 2)
+            # One vectorized lookup: an (N, 4) RGBA array that LineCollection
+            # takes as-is, instead of one colormap call per model.
+            colors = color_map(np.arange(len(model_names)))
+            for model_name, color in zip(model_names, colors):
+                color_dicts[model_name] = color
+        return color_dicts
 
-    def _draw_feature(self, i_feature: int, ax, data_size: int, draw_horizon: int):
+    def _draw_feature(self, i_feature: int, ax, data_size: int, draw_horizon: int, color_dicts: dict):
         """
         Draw forecasting results for all models and one feature.
         Args:
@@ -1243,18 +1719,26 @@ class ForecastEstimator:
             ax: `matplotlib.axes.Axes` object
             data_size: Integer, number of drawing points in data.
             draw_horizon: Integer, number of drawing points for each time windows.
+            color_dicts: Dictionary, model name to color, computed once per figure in `draw`.
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+
         def draw_windows(data, start_x=0, color='indigo', label='Data', alpha=1.0):
-            timeline = []
+            segments = []
+            window_length = data.shape[1]
             for p in range(data.shape[0]):
-                y = data[p]
-                timeline.append(y[0])
-                x = range(p + start_x, p + y.shape[0] + start_x)
-                if p == (data.shape[0] - 1):
-                    ax.plot(x, y, marker='.', color=color, label=label, alpha=alpha, markersize=2)
-                else:
-                    ax.plot(x, y, marker='.', color=color, alpha=alpha, markersize=2)
-            x = range(start_x, len(timeline) + start_x)
+                x = np.arange(p + start_x, p + window_length + start_x)
+                segments.append(np.column_stack([x, data[p]]))
+            # One collection for all windows instead of one ax.plot call per window.
+            ax.add_collection(LineCollection(segments, colors=color, alpha=alpha, linewidths=1))
+            points = np.concatenate(segments)
+            ax.scatter(points[:, 0], points[:, 1], color=color, alpha=alpha, marker='.', s=4)
+            # Empty line with the same style, so the legend gets exactly one entry.
+            ax.plot([], [], marker='.', color=color, label=label, alpha=alpha, markersize=2)
+            # The first point of every window is the series itself: a view, not a loop.
+            timeline = data[:, 0]
+            x = np.arange(start_x, start_x + data.shape[0])
             ax.plot(x, timeline, color=color, alpha=alpha)
 
         target_start_point = 0
@@ -1274,19 +1758,6 @@ class ForecastEstimator:
                          label='True')
 
         if self.pred:
-            model_names = list(self.pred.keys())
-            color_dicts = {}
-            if 'naive' in model_names:
-                model_names.remove('naive')
-                color_dicts['naive'] = 'grey'
-
-            if len(model_names) == 1:
-                color_dicts[model_names[0]] = 'orange'
-            else:
-                color_map = plt.cm.get_cmap('twilight', len(model_names) + 2)
-                for i, model_name in enumerate(model_names):
-                    color_dicts[model_name] = color_map(i)
-
             for model_name, pred_vals in self.pred.items():
                 if connection_line:
                     connection_line['y'][1] = pred_vals[0][0, i_feature]
@@ -1306,6 +1777,8 @@ class ForecastEstimator:
             features_names: List or `None`, list of feature for drawing.
             title: String, title of the figure.
         """
+        import matplotlib.pyplot as plt
+
         if features_names is None:
             if self.features_names is None:
                 features_names = [str(i) for i in range(self.true.shape[2])]
@@ -1327,28 +1800,35 @@ class ForecastEstimator:
             n_rows = int(n / 2)
         else:
             n_cols = 2
-            n_rows = int(math.floor(n / 2))
+            # Round up so an odd feature count still gets a cell for every
+            # feature; the single leftover cell is hidden below.
+            n_rows = math.ceil(n / 2)
 
         fig, axs = plt.subplots(n_rows, n_cols, sharex='col', figsize=(n_cols * 6, n_rows * 3))
         fig.tight_layout(pad=2.3)
         fig.supxlabel('Time')
         fig.suptitle(title)
 
+        color_dicts = self._model_colors()
+
         i_feature = 0
         for i in range(n_rows):
             if n_cols == 1:
                 if n_rows == 1:
-                    self._draw_feature(i_feature, axs, size, draw_horizon)
+                    self._draw_feature(i_feature, axs, size, draw_horizon, color_dicts)
                     axs.set_ylabel(features_names[i_feature])
                 else:
-                    self._draw_feature(i_feature, axs[i], size, draw_horizon)
+                    self._draw_feature(i_feature, axs[i], size, draw_horizon, color_dicts)
                     axs[i].set_ylabel(features_names[i_feature])
                 i_feature = i_feature + 1
             else:
                 for j in range(n_cols):
-                    if i_feature > n:
-                        break
-                    self._draw_feature(i_feature, axs[i, j], size, draw_horizon)
+                    if i_feature >= n:
+                        # No feature left for this cell: hide it instead of
+                        # leaving an empty set of axes on the figure.
+                        axs[i, j].set_visible(False)
+                        continue
+                    self._draw_feature(i_feature, axs[i, j], size, draw_horizon, color_dicts)
                     axs[i, j].set_ylabel(features_names[i_feature])
                     i_feature = i_feature + 1
         plt.show()
@@ -5,6 +5,7 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 import foressment_ai as foras
 import unittest
 import inspect
+import tempfile
 import numpy as np
 
 
@@ -91,6 +92,25 @@ class TestDeepForecasterParameters(unittest.TestCase):
         with self.assertRaises(AssertionError, msg=message):
             params.new_var = 1000
 
+    def test_json_round_trip(self):
+        print(inspect.stack()[0][3])
+        message = 'Parameters are not restored from JSON-file'
+        params = foras.DeepForecasterParameters(4, 100, 10, block_type='GRU',
+                                                units=[512, 128], dropout=0.1)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'params.json')
+            params.save_json(filename)
+            restored = foras.DeepForecasterParameters()
+            restored.read_json(filename)
+
+        # The live optimizer instance is serialized as its keras identifier.
+        self.assertEqual(restored.optimizer, 'adam', message + ' <optimizer>')
+        for name in ['n_features', 'look_back_length', 'horizon', 'units',
+                     'block_type', 'dropout', 'hidden_activation',
+                     'output_activation', 'loss', 'n_rec_layers', 'jit_compile']:
+            self.assertEqual(getattr(restored, name), getattr(params, name),
+                             message + ' <{}>'.format(name))
+
 
 class TestTSGenerator(unittest.TestCase):
     def __init__(self, *args, **kwargs):
@@ -143,6 +163,20 @@ class TestTSGenerator(unittest.TestCase):
             with self.assertRaises(AssertionError, msg='Unable to retrieve targets'):
                 tg.get_targets(window_id=100000)
 
+    def test_as_tf_dataset(self):
+        print(inspect.stack()[0][3])
+        message = 'The dataset does not match the generated time windows'
+        params = foras.ForecasterParameters()
+        data = np.random.randint(1, 10, 200)
+        tg = foras.TSGenerator(data, params)
+
+        batches = list(tg.as_tf_dataset(batch_size=32).as_numpy_iterator())
+        x = np.concatenate([b[0] for b in batches])
+        y = np.concatenate([b[1] for b in batches])
+
+        self.assertTrue(np.array_equal(x, tg.get_data()), message + ' <data>')
+        self.assertTrue(np.array_equal(y, tg.get_targets()), message + ' <targets>')
+
 
 class TestNaiveForecaster(unittest.TestCase):
     def __init__(self, *args, **kwargs):
@@ -294,6 +328,49 @@ class TestForecastEstimator(unittest.TestCase):
         est.estimate()
         self.assertFalse(est.quality.empty, message)
 
+    def test_estimate_matches_sklearn(self):
+        print(inspect.stack()[0][3])
+        message = 'Metric does not match sklearn'
+        from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+
+        true = np.random.rand(50, 10, 3)
+        pred = np.random.rand(50, 10, 3)
+        est = foras.ForecastEstimator()
+        est.set_true_values(true, dtype=np.float64)
+        est.set_pred_values(pred, model_name='model', dtype=np.float64)
+        est.estimate()
+
+        true_2d = true.reshape((-1, 3))
+        pred_2d = pred.reshape((-1, 3))
+        mse_raw = mean_squared_error(true_2d, pred_2d, multioutput='raw_values')
+        rmse_raw = np.sqrt(mse_raw)
+        mae_raw = mean_absolute_error(true_2d, pred_2d, multioutput='raw_values')
+        r2_raw = r2_score(true_2d, pred_2d, multioutput='raw_values')
+
+        expected = {'model_MSE': np.append(mse_raw, mean_squared_error(true_2d, pred_2d)),
+                    'model_RMSE': np.append(rmse_raw, rmse_raw.mean()),
+                    'model_MAE': np.append(mae_raw, mean_absolute_error(true_2d, pred_2d)),
+                    'model_R2': np.append(r2_raw, r2_score(true_2d, pred_2d))}
+        for column, values in expected.items():
+            self.assertTrue(np.allclose(est.quality[column].values, values),
+                            message + ' <{}>'.format(column))
+
+    def test_draw_all_features(self):
+        print(inspect.stack()[0][3])
+        message = 'Not every feature got a populated subplot'
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
+        est = foras.ForecastEstimator()
+        est.set_true_values(np.random.rand(4, 2, 5))
+        est.set_pred_values(np.random.rand(4, 2, 5), model_name='model')
+        # 5 features: an odd count, which needs a 2x3 grid with one hidden cell.
+        est.draw(size=4)
+        visible_axes = [ax for ax in plt.gcf().axes if ax.get_visible()]
+        self.assertEqual(len(visible_axes), 5, message)
+        plt.close('all')
+
 
 if __name__ == '__main__':
     unittest.main()